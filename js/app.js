@@ -35,6 +35,7 @@ class PVFaultDetector {
         this.previewVideo = document.getElementById('preview-video');
         this.videoOptions = document.getElementById('video-options');
         this.frameInterval = document.getElementById('frame-interval');
+        this.batchSize = document.getElementById('batch-size');
         this.clearBtn = document.getElementById('clear-btn');
         this.analyzeBtn = document.getElementById('analyze-btn');
         
@@ -287,12 +288,16 @@ class PVFaultDetector {
             const formData = new FormData();
             formData.append('video', this.selectedFile);
             formData.append('frame_interval', this.frameInterval.value);
+            formData.append('batch_size', this.batchSize.value);
 
-            // Use XMLHttpRequest for progress tracking
+            // Use XMLHttpRequest for progress tracking. The server streams
+            // NDJSON: one JSON record per line as each frame finishes, then
+            // a final line with the summary. Older servers return a single
+            // JSON blob instead - detected via Content-Type.
             const result = await new Promise((resolve, reject) => {
                 const xhr = new XMLHttpRequest();
                 xhr.open('POST', `${CONFIG.API_BASE_URL}${CONFIG.ENDPOINTS.ANALYZE_VIDEO}`);
-                
+
                 xhr.upload.onprogress = (e) => {
                     if (e.lengthComputable) {
                         const pct = (e.loaded / e.total) * 30; // Upload is 30% of total
@@ -301,38 +306,63 @@ class PVFaultDetector {
                     }
                 };
 
-                xhr.onload = () => {
-                    if (xhr.status === 200) {
-                        resolve(JSON.parse(xhr.responseText));
-                    } else {
-                        reject(new Error(`Server error: ${xhr.status}`));
+                let isStream = false;
+                xhr.onreadystatechange = () => {
+                    if (xhr.readyState === XMLHttpRequest.HEADERS_RECEIVED) {
+                        const type = xhr.getResponseHeader('Content-Type') || '';
+                        isStream = type.includes('ndjson');
                     }
                 };
 
-                xhr.onerror = () => reject(new Error('Network error'));
-                xhr.send(formData);
-                
-                // Simulate processing progress after upload
-                let progress = 30;
-                const progressInterval = setInterval(() => {
-                    if (progress < 90) {
-                        progress += 2;
-                        this.progressFill.style.width = `${progress}%`;
-                        this.loadingSubtext.textContent = 'Analyzing frames...';
+                const frames = [];
+                let summary = {};
+                let parsed = 0;
+
+                // Consume complete NDJSON lines as the response grows
+                const consumeLines = (final = false) => {
+                    const text = xhr.responseText;
+                    let end;
+                    while ((end = text.indexOf('\n', parsed)) !== -1) {
+                        this.consumeRecord(text.slice(parsed, end), frames, summary);
+                        parsed = end + 1;
+                    }
+                    if (final && parsed < text.length) {
+                        this.consumeRecord(text.slice(parsed), frames, summary);
+                        parsed = text.length;
+                    }
+                };
+
+                xhr.onprogress = () => {
+                    if (isStream) {
+                        consumeLines();
+                        const pct = Math.min(90, 30 + frames.length * 2);
+                        this.progressFill.style.width = `${pct}%`;
+                        this.loadingSubtext.textContent = `Analyzed ${frames.length} frames...`;
                     } else {
-                        clearInterval(progressInterval);
+                        this.loadingSubtext.textContent = 'Analyzing frames...';
                     }
-                }, 500);
+                };
 
                 xhr.onload = () => {
-                    clearInterval(progressInterval);
                     this.progressFill.style.width = '100%';
-                    if (xhr.status === 200) {
-                        resolve(JSON.parse(xhr.responseText));
-                    } else {
+                    if (xhr.status !== 200) {
                         reject(new Error(`Server error: ${xhr.status}`));
+                        return;
+                    }
+                    try {
+                        if (isStream) {
+                            consumeLines(true);
+                            resolve({ total_frames: frames.length, frames, ...summary });
+                        } else {
+                            resolve(JSON.parse(xhr.responseText));
+                        }
+                    } catch (err) {
+                        reject(new Error('Invalid server response'));
                     }
                 };
+
+                xhr.onerror = () => reject(new Error('Network error'));
+                xhr.send(formData);
             });
 
             this.videoResults = result;
@@ -349,6 +379,19 @@ class PVFaultDetector {
         }
     }
 
+    // Parse one NDJSON line: frame records go to frames, the final
+    // summary record is merged into summary
+    consumeRecord(line, frames, summary) {
+        const trimmed = line.trim();
+        if (!trimmed) return;
+        const record = JSON.parse(trimmed);
+        if (record.summary) {
+            Object.assign(summary, record.summary);
+        } else {
+            frames.push(record);
+        }
+    }
+
     // ===== Results Display =====
     displayResults(result) {
         // Show results section
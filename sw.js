@@ -1,5 +1,5 @@
 // Service Worker for PV Fault Detector PWA
-const CACHE_NAME = 'pv-fault-detector-v1';
+const CACHE_NAME = 'pv-fault-detector-v3';
 const ASSETS_TO_CACHE = [
     '/',
     '/index.html',